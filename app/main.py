@@ -1,13 +1,31 @@
 # app/main.py
 
+import logging
+
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from app.routes import router
-# Initialize FastAPI app
-app = FastAPI()
+from app.service import init_http_client, close_http_client
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s %(levelname)s %(name)s %(message)s"
+)
+
+# Initialize FastAPI app; orjson serializes the large transcript payloads
+# noticeably faster than the default JSON encoder
+app = FastAPI(default_response_class=ORJSONResponse)
 
 # Include the routes from routes.py
 app.include_router(router)
 
+@app.on_event("startup")
+async def startup():
+    await init_http_client()
+
+@app.on_event("shutdown")
+async def shutdown():
+    await close_http_client()
+
 @app.get("/")
 def root():
     return {"message": "YouTube Info Service is running"}
@@ -1,17 +1,85 @@
+import asyncio
 from fastapi import APIRouter, HTTPException
-from app.service import fetch_video_info, transcription_statuses
+from fastapi.responses import ORJSONResponse
+from app.service import (
+    fetch_video_info,
+    get_cached_video_info,
+    invalidate_video_cache,
+    job_registry,
+    notify_transcription_complete,
+    pop_video_info_job,
+    submit_video_info_job,
+)
 
 router = APIRouter()
 
+@router.get("/video-info")
+async def get_video_info_batch(ids: str):
+    """
+    Fetch video info for several comma-separated video ids at once.
+    Details for the whole batch share one YouTube API call per 50 ids.
+    """
+    id_list = list(dict.fromkeys(i.strip() for i in ids.split(",") if i.strip()))
+    if not id_list:
+        raise HTTPException(status_code=400, detail="No video ids provided")
+
+    results = await asyncio.gather(
+        *(fetch_video_info(video_id) for video_id in id_list),
+        return_exceptions=True
+    )
+    return {
+        video_id: ({"error": str(result)} if isinstance(result, BaseException) else result)
+        for video_id, result in zip(id_list, results)
+    }
+
 @router.get("/video-info/{video_id}")
-async def get_video_info(video_id: str):
+async def get_video_info(video_id: str, wait: bool = False):
     """
     Fetch video metadata and transcript information.
-    Returns video details along with the transcription status.
+
+    Cached results return immediately. Otherwise the fetch (which can take
+    minutes when audio transcription kicks in) runs in the background and
+    the response is a 202 with a pending status; poll this route until the
+    result is ready. Pass ?wait=true to block for the result instead, which
+    preserves the original synchronous behavior.
     """
-    try:
-        video_info = fetch_video_info(video_id)        
+    if wait:
+        try:
+            return await fetch_video_info(video_id)
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=str(e))
+
+    video_info = await get_cached_video_info(video_id)
+    if video_info is not None:
         return video_info
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+
+    status = await job_registry.get(video_id)
+    if status == "pending":
+        return ORJSONResponse(status_code=202, content={"video_id": video_id, "status": "pending"})
+    if status in ("completed", "failed"):
+        status, result = await pop_video_info_job(video_id)
+        if status == "failed":
+            raise HTTPException(status_code=500, detail=(result or {}).get("error", "Unknown error"))
+        if result is not None:
+            return result
+        # The uncacheable result lives on another worker; fetch it fresh
+
+    return ORJSONResponse(status_code=202, content=await submit_video_info_job(video_id))
+
+@router.post("/transcribe-callback")
+async def transcribe_callback(payload: dict):
+    """
+    Internal route for Transcribe completion notifications (EventBridge rule
+    or SNS HTTP subscription). Wakes the request waiting on the job.
+    """
+    notified = notify_transcription_complete(payload)
+    return {"notified": notified}
+
+@router.post("/cache/invalidate/{video_id}")
+async def invalidate_cache(video_id: str):
+    """
+    Admin route: drop cached metadata/transcript for a video id.
+    """
+    evicted = await invalidate_video_cache(video_id)
+    return {"video_id": video_id, "evicted": evicted}
 
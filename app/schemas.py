@@ -0,0 +1,15 @@
+# app/schemas.py
+
+from typing import List, Optional
+from typing_extensions import Literal
+from pydantic import BaseModel
+
+class TranscriptResult(BaseModel):
+    """
+    Discriminated transcript payload. The transcript field of a video-info
+    response is always this shape — clients switch on status instead of
+    guessing whether they got a list of segments or an error string.
+    """
+    status: Literal["ok", "unavailable", "disabled", "failed"]
+    segments: List[str] = []
+    error: Optional[str] = None